@@ -1,4 +1,6 @@
 import time
+from concurrent.futures import ThreadPoolExecutor
+
 from data.screens import ScreenType
 
 import debug
@@ -19,25 +21,38 @@ class Data:
         # Save the parsed config
         self.config = config
 
-        # get schedule
-        self.schedule: Schedule = Schedule(config)
-        # NB: Can return none, but shouldn't matter?
-        self.current_game: Game = self.schedule.get_preferred_game()
-        if self.current_game is not None:
-            self.print_game_data_debug()
+        # The initial fetches are all independent network calls, so run them concurrently
+        # and startup only costs us the slowest fetch instead of the sum of all of them.
+        with ThreadPoolExecutor(max_workers=3, thread_name_prefix="startup_fetch") as executor:
+            schedule_future = executor.submit(Schedule, config)
 
-        self.game_changed_time = time.time()
-        if self.current_game is not None:
-            self.__update_layout_state()
+            def headlines_then_standings():
+                # standings need the playoff start date from the headlines, so these two stay in order
+                headlines = Headlines(config, schedule_future.result().date.year)
+                standings = Standings(config, headlines.important_dates.playoffs_start_date)
+                return headlines, standings
+
+            weather_future = executor.submit(Weather, config)
+            offday_future = executor.submit(headlines_then_standings)
 
-        # Weather info
-        self.weather: Weather = Weather(config)
+            # get schedule
+            self.schedule: Schedule = schedule_future.result()
+            # NB: Can return none, but shouldn't matter?
+            self.current_game: Game = self.schedule.get_preferred_game()
+            if self.current_game is not None:
+                self.print_game_data_debug()
 
-        # News headlines
-        self.headlines: Headlines = Headlines(config, self.schedule.date.year)
+            self.game_changed_time = time.time()
+            if self.current_game is not None:
+                self.__update_layout_state()
 
-        # Fetch all standings data for today
-        self.standings: Standings = Standings(config, self.headlines.important_dates.playoffs_start_date)
+            # Weather info
+            self.weather: Weather = weather_future.result()
+
+            # News headlines and all standings data for today
+            self.headlines: Headlines
+            self.standings: Standings
+            self.headlines, self.standings = offday_future.result()
 
         # Network status state - we useweather condition as a sort of sentinial value
         self.network_issues: bool = self.weather.conditions == "Error"
@@ -107,6 +122,27 @@ class Data:
         elif status == UpdateStatus.FAIL:
             self.network_issues = True
 
+    def next_refresh_interval(self):
+        """Returns how many seconds the refresh loops should sleep before waking again.
+
+        There is no reason to poll at live cadence between innings, during warmup, or on
+        offdays, so pick a rate based on how quickly the data can actually change. The
+        fast intervals assume the caller is actually refreshing game data; loops that
+        only refresh news or standings should clamp this to their own floor."""
+        if self.schedule.is_offday():
+            return 300
+        if not self.schedule.games_live():
+            # nothing live; standings/news update rates are measured in minutes anyway
+            return 60
+        game = self.current_game
+        if game is None:
+            return 30
+        if game.status() == status.WARMUP:
+            return 60
+        if status.is_inning_break(game.inning_state()):
+            return 30
+        return 5
+
     def get_screen_type(self) -> ScreenType:
         # Always the news
         if self.config.news_ticker_always_display:
@@ -130,17 +166,24 @@ class Data:
     def __update_layout_state(self):
         import data.config.layout as layout
 
-        self.config.layout.set_state()
-        if self.current_game.status() == status.WARMUP:
-            self.config.layout.set_state(layout.LAYOUT_STATE_WARMUP)
-
-        if self.current_game.is_no_hitter():
-            self.config.layout.set_state(layout.LAYOUT_STATE_NOHIT)
-
-        if self.current_game.is_perfect_game():
-            self.config.layout.set_state(layout.LAYOUT_STATE_PERFECT)
+        # highest-priority state wins, and set_state only needs to be called once
+        game = self.current_game
+        if game.is_perfect_game():
+            state = layout.LAYOUT_STATE_PERFECT
+        elif game.is_no_hitter():
+            state = layout.LAYOUT_STATE_NOHIT
+        elif game.status() == status.WARMUP:
+            state = layout.LAYOUT_STATE_WARMUP
+        else:
+            state = None
+        self.config.layout.set_state(state)
 
     def print_game_data_debug(self):
+        # the Pregame/Scoreboard/Postgame objects below parse big chunks of the game
+        # feed just to be formatted into log lines, so don't build them for nothing
+        if not debug.is_enabled():
+            return
+
         debug.log("Game Data Refreshed: %s", self.current_game._current_data["gameData"]["game"]["id"])
         debug.log("Current game is %d seconds behind", self.current_game.current_delay())
         debug.log("Pre: %s", Pregame(self.current_game, self.config.time_format))
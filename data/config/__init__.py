@@ -1,6 +1,7 @@
 import json
 import os
 import sys
+from datetime import datetime
 
 import debug
 from data import status
@@ -93,6 +94,7 @@ class Config:
 
         # Check the preferred teams and divisions are a list or a string
         self.check_time_format()
+        self.check_end_of_day()
         self.check_preferred_teams()
         self.check_preferred_divisions()
 
@@ -135,6 +137,14 @@ class Config:
             division = self.preferred_divisions
             self.preferred_divisions = [division]
 
+    def check_end_of_day(self):
+        # Parse once here so the schedule and standings don't re-strptime it on every refresh
+        try:
+            self.end_of_day = datetime.strptime(self.end_of_day, "%H:%M").time()
+        except ValueError:
+            debug.warning('end_of_day should be a time in the format "HH:MM". Using default value of 00:00')
+            self.end_of_day = datetime.strptime("00:00", "%H:%M").time()
+
     def check_time_format(self):
         if self.time_format.lower() == "24h":
             self.time_format = TIME_FORMAT_24H
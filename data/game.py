@@ -1,26 +1,77 @@
+import copy
 import time
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
-from typing import Optional
+from typing import List, Optional
 
 import statsapi
 
 import debug
+from data.network import call_with_retry, network_request
 from data.update import UpdateStatus
 from data.delay_buffer import CircularQueue
 
-API_FIELDS = (
+_RAW_API_FIELDS = (
     "gameData,game,id,datetime,dateTime,officialDate,flags,noHitter,perfectGame,status,detailedState,abstractGameState,"
     + "reason,probablePitchers,teams,home,away,abbreviation,teamName,players,id,boxscoreName,fullName,liveData,plays,"
     + "currentPlay,result,eventType,playEvents,isPitch,pitchData,startSpeed,details,type,code,description,decisions,"
     + "winner,loser,save,id,linescore,outs,balls,strikes,note,inningState,currentInning,currentInningOrdinal,offense,"
     + "batter,inHole,onDeck,first,second,third,defense,pitcher,boxscore,teams,runs,players,seasonStats,pitching,wins,"
-    + "losses,saves,era,hits,errors,stats,pitching,numberOfPitches,weather,condition,temp,wind"
+    + "losses,saves,era,hits,errors,stats,pitching,numberOfPitches,weather,condition,temp,wind,metaData,timeStamp"
 )
 
+# The fields parameter is a flat list of key names, so the duplicates above ("id",
+# "teams", "players", ...) only pad the query string. Dedupe once at import time.
+API_FIELDS = ",".join(sorted(set(_RAW_API_FIELDS.split(","))))
+
 SCHEDULE_API_FIELDS = "dates,date,games,status,detailedState,abstractGameState,reason"
 
 GAME_UPDATE_RATE = 10
 
+BULK_FETCH_WORKERS = 6  # cap concurrent game fetches so we don't spam the API
+
+# Refetch the whole feed every so often even when diffs keep applying cleanly, in case a
+# skipped patch op left our copy slightly behind the server's.
+FULL_FETCH_INTERVAL = 10
+
+
+def _apply_patch_op(data, op):
+    """Applies one RFC 6902 style operation from the diffPatch feed to data in place.
+
+    Ops whose path walks into a subtree our fields projection stripped are skipped; they
+    can't affect anything we keep. Unsupported op types raise so the caller falls back to
+    a full fetch."""
+    kind = op["op"]
+    if kind not in ("add", "replace", "remove"):
+        raise ValueError("unsupported patch op: {}".format(kind))
+
+    parts = [part.replace("~1", "/").replace("~0", "~") for part in op["path"].lstrip("/").split("/")]
+    target = data
+    for part in parts[:-1]:
+        if isinstance(target, list):
+            target = target[int(part)]
+        elif part in target:
+            target = target[part]
+        else:
+            return  # path was stripped by the fields projection
+
+    key = parts[-1]
+    if isinstance(target, list):
+        if kind == "add":
+            if key == "-":
+                target.append(op["value"])
+            else:
+                target.insert(int(key), op["value"])
+        elif kind == "replace":
+            target[int(key)] = op["value"]
+        else:
+            del target[int(key)]
+    else:
+        if kind in ("add", "replace"):
+            target[key] = op["value"]
+        elif key in target:
+            del target[key]
+
 
 class Game:
     @staticmethod
@@ -36,6 +87,18 @@ class Game:
             return game
         return None
 
+    @staticmethod
+    def fetch_bulk(scheduled_games, delay) -> List[Optional["Game"]]:
+        """Builds Games for several scheduled games, fetching their data concurrently.
+
+        A serial fetch costs one round-trip per game; fanning out over a small thread
+        pool brings N games close to a single round-trip. Failed fetches come back as
+        None in the corresponding slot, same as from_scheduled."""
+        if len(scheduled_games) <= 1:
+            return [Game.from_scheduled(game_data, delay) for game_data in scheduled_games]
+        with ThreadPoolExecutor(max_workers=BULK_FETCH_WORKERS, thread_name_prefix="game_fetch") as executor:
+            return list(executor.map(lambda game_data: Game.from_scheduled(game_data, delay), scheduled_games))
+
     def __init__(self, game_id, date, broadcasts, series_status, delay_in_10s_of_seconds):
         self.game_id = game_id
         self.date = date
@@ -45,13 +108,21 @@ class Game:
         self._broadcasts = broadcasts
         self._series_status = series_status
         self._status = {}
+        # statsapi.get never mutates its params, so build them once and reuse them
+        self._api_params = {"gamePk": game_id, "fields": API_FIELDS}
+        # the newest (undelayed) feed plus its timecode, used to fetch diffs instead of full feeds
+        self._live_data = None
+        self._last_timestamp = ""
+        self._updates_since_full_fetch = 0
 
     def update(self, force=False) -> UpdateStatus:
         if force or self.__should_update():
             self.starttime = time.time()
-            try:
+            with network_request("refreshing the current game data") as request:
                 debug.log("Fetching data for game %s", str(self.game_id))
-                live_data = statsapi.get("game", {"gamePk": self.game_id, "fields": API_FIELDS})
+                live_data = self.__fetch_live_data()
+                self._live_data = live_data
+                self._last_timestamp = live_data.get("metaData", {}).get("timeStamp", "")
                 # we add a delay to avoid spoilers. During construction, this will still yield live data, but then
                 # it will recycle that data until the queue is full.
                 self._data_wait_queue.push(live_data)
@@ -70,12 +141,50 @@ class Game:
                     except:
                         debug.error("Failed to get game status from schedule")
 
-                return UpdateStatus.SUCCESS
-            except:
-                debug.exception("Networking Error while refreshing the current game data.")
+            if not request.ok:
                 return UpdateStatus.FAIL
+            return UpdateStatus.SUCCESS
         return UpdateStatus.DEFERRED
 
+    def __fetch_live_data(self):
+        """Fetches the game feed, preferring a diff against the last update over a full download.
+
+        Mid-inning refreshes usually change a handful of fields, so the diffPatch endpoint cuts
+        the payload from tens of kilobytes to about one. Any trouble fetching or applying the
+        diff falls back to the normal full fetch."""
+        if (
+            self._live_data is not None
+            and self._last_timestamp
+            and self._updates_since_full_fetch < FULL_FETCH_INTERVAL
+        ):
+            live_data = self.__fetch_and_apply_diff()
+            if live_data is not None:
+                self._updates_since_full_fetch += 1
+                return live_data
+        self._updates_since_full_fetch = 0
+        return call_with_retry(statsapi.get, "game", self._api_params)
+
+    def __fetch_and_apply_diff(self):
+        try:
+            diff = statsapi.get(
+                "game_diff", {"gamePk": self.game_id, "startTimecode": self._last_timestamp, "endTimecode": ""}
+            )
+        except Exception:
+            debug.log("Diff fetch failed for game %s, falling back to a full fetch", str(self.game_id))
+            return None
+        if isinstance(diff, dict):
+            # when the timecode window is invalid the endpoint just sends the whole feed
+            return diff if "gameData" in diff else None
+        try:
+            live_data = copy.deepcopy(self._live_data)
+            for patch in diff:
+                for op in patch.get("diff", []):
+                    _apply_patch_op(live_data, op)
+            return live_data
+        except Exception:
+            debug.log("Could not apply diff for game %s, falling back to a full fetch", str(self.game_id))
+            return None
+
     def datetime(self):
         time = self._current_data["gameData"]["datetime"]["dateTime"]
         return datetime.fromisoformat(time.replace("Z", "+00:00"))
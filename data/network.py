@@ -0,0 +1,57 @@
+import random
+import time
+from contextlib import contextmanager
+
+import debug
+
+RETRY_MAX_ATTEMPTS = 4
+RETRY_BASE_DELAY = 0.5  # seconds
+RETRY_DELAY_CAP = 8.0  # seconds
+
+
+def call_with_retry(fn, *args, max_attempts=RETRY_MAX_ATTEMPTS, base=RETRY_BASE_DELAY, cap=RETRY_DELAY_CAP, **kwargs):
+    """Calls fn, retrying transient failures with exponential backoff and full jitter.
+
+    The sleep before each retry is a random draw from the backoff window so that many
+    scoreboards don't hammer the API in lockstep after a shared hiccup. The final
+    failure is re-raised, so callers keep their existing error handling."""
+    for attempt in range(max_attempts):
+        try:
+            return fn(*args, **kwargs)
+        except Exception:
+            if attempt == max_attempts - 1:
+                raise
+            delay = random.uniform(0, min(cap, base * 2**attempt))
+            debug.log("Retrying %s in %.2fs (attempt %d failed)", getattr(fn, "__name__", fn), delay, attempt + 1)
+            time.sleep(delay)
+
+
+class NetworkRequest:
+    """Records whether a guarded block of network calls completed cleanly."""
+
+    def __init__(self):
+        self.ok = True
+
+
+@contextmanager
+def network_request(description):
+    """Guards a block of network calls, turning any exception into a flag plus a log line.
+
+    The update methods all repeated the same try/except dance to map failures onto
+    UpdateStatus.FAIL; with this they just check request.ok afterwards. Also times the
+    block so slow fetches show up in the debug log.
+
+        with network_request("refreshing schedule") as request:
+            ...
+        if not request.ok:
+            return UpdateStatus.FAIL
+    """
+    request = NetworkRequest()
+    started = time.perf_counter()
+    try:
+        yield request
+    except Exception:
+        request.ok = False
+        debug.exception("Networking error while %s", description)
+    finally:
+        debug.log("%s took %.3fs", description, time.perf_counter() - started)
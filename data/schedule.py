@@ -7,21 +7,51 @@ import data.teams
 import debug
 from data import status
 from data.game import Game
+from data.network import call_with_retry, network_request
 from data.update import UpdateStatus
 
 GAMES_REFRESH_RATE = 6 * 60
 
+# The schedule for a date rarely changes minute to minute, so cache responses briefly
+# to absorb forced updates. Keep the live TTL well under GAMES_REFRESH_RATE so the
+# periodic refresh still reaches the API. Past dates (demo mode) effectively never change.
+SCHEDULE_CACHE_TTL = 60
+SCHEDULE_CACHE_TTL_PAST = 6 * 60 * 60
+
+_schedule_cache = {}
+
+
+def _fetch_schedule(date, date_str):
+    """Fetches the schedule for a date via statsapi, serving repeat requests from a TTL cache."""
+    ttl = SCHEDULE_CACHE_TTL_PAST if date.date() < datetime.today().date() else SCHEDULE_CACHE_TTL
+    cached = _schedule_cache.get(date_str)
+    if cached is not None and time.time() - cached[0] < ttl:
+        return cached[1]
+    games = call_with_retry(statsapi.schedule, date_str)
+    _schedule_cache[date_str] = (time.time(), games)
+    return games
+
 
 class Schedule:
     def __init__(self, config):
         self.config = config
+        # Resolve the configured team names to the full names the schedule API uses
+        # once, instead of rebuilding the lookups on every pass over the games.
+        self._preferred_team_names = tuple(data.teams.TEAM_FULL[team] for team in config.preferred_teams)
+        self._preferred_team_name_set = frozenset(self._preferred_team_names)
         self.date = self.__parse_today()
+        # the formatted date doubles as the statsapi key, so format it once per day change
+        self._date_str = self.date.strftime("%Y-%m-%d")
         self.starttime = time.time()
         self.current_idx = 0
         # all games for the day
         self.__all_games = []
         # the actual (filtered) schedule
         self._games = []
+        # lookup tables rebuilt on every schedule update so the hot paths don't
+        # have to scan the game lists
+        self._game_indices_by_team = {}
+        self._teams_playing = frozenset()
         self.update(True)
 
     def __parse_today(self):
@@ -29,9 +59,7 @@ class Schedule:
             today = datetime.strptime(self.config.demo_date, "%Y-%m-%d")
         else:
             today = datetime.today()
-            end_of_day = datetime.strptime(self.config.end_of_day, "%H:%M").replace(
-                year=today.year, month=today.month, day=today.day
-            )
+            end_of_day = datetime.combine(today, self.config.end_of_day)
             if end_of_day > datetime.now():
                 today -= timedelta(days=1)
         return today
@@ -39,29 +67,30 @@ class Schedule:
     def update(self, force=False) -> UpdateStatus:
         if force or self.__should_update():
             self.date = self.__parse_today()
+            self._date_str = self.date.strftime("%Y-%m-%d")
             debug.log("Updating schedule for %s", self.date)
             self.starttime = time.time()
-            try:
-                self.__all_games = statsapi.schedule(self.date.strftime("%Y-%m-%d"))
-            except:
-                debug.exception("Networking error while refreshing schedule")
+            with network_request("refreshing schedule") as request:
+                self.__all_games = _fetch_schedule(self.date, self._date_str)
+            if not request.ok:
                 return UpdateStatus.FAIL
-            else:
-                games = self.__all_games
 
-                if self.config.rotation_only_preferred:
-                    games = Schedule.__filter_list_of_games(self.__all_games, self.config.preferred_teams)
-                if self.config.rotation_only_live:
-                    live_games = [g for g in games if status.is_live(g["status"]) or status.is_fresh(g["status"])]
-                    if live_games:
-                        # we never have games drop down to [], since we may still be indexing into it
-                        # but this is fine, since self.games_live() is will work even if we don't do this update
-                        games = live_games
+            games = self.__all_games
+
+            if self.config.rotation_only_preferred:
+                games = self.__filter_list_of_games(self.__all_games)
+            if self.config.rotation_only_live:
+                live_games = [g for g in games if status.is_live(g["status"]) or status.is_fresh(g["status"])]
+                if live_games:
+                    # we never have games drop down to [], since we may still be indexing into it
+                    # but this is fine, since self.games_live() is will work even if we don't do this update
+                    games = live_games
 
-                self.current_idx %= len(games)
-                self._games = games
+            self.current_idx %= len(games)
+            self._games = games
+            self.__rebuild_team_indices()
 
-                return UpdateStatus.SUCCESS
+            return UpdateStatus.SUCCESS
 
         return UpdateStatus.DEFERRED
 
@@ -69,13 +98,21 @@ class Schedule:
         endtime = time.time()
         return endtime - self.starttime >= GAMES_REFRESH_RATE
 
+    def __rebuild_team_indices(self):
+        indices_by_team = {}
+        for i, game in enumerate(self._games):
+            indices_by_team.setdefault(game["home_name"], []).append(i)
+            indices_by_team.setdefault(game["away_name"], []).append(i)
+        self._game_indices_by_team = indices_by_team
+        self._teams_playing = frozenset(
+            name for game in self.__all_games for name in (game["away_name"], game["home_name"])
+        )
+
     # offday code
     def is_offday_for_preferred_team(self):
-        if self.config.preferred_teams:
-            return not any(
-                data.teams.TEAM_FULL[self.config.preferred_teams[0]] in [game["away_name"], game["home_name"]]
-                for game in self.__all_games  # only care if preferred team is actually in list
-            )
+        if self._preferred_team_names:
+            # only care if preferred team is actually in the day's list
+            return self._preferred_team_names[0] not in self._teams_playing
         else:
             return True
 
@@ -86,7 +123,8 @@ class Schedule:
             return not len(self._games)
 
     def games_live(self):
-        return any(status.is_fresh(g["status"]) or (status.is_live(g["status"])) for g in self._games)
+        live = status.GAME_STATE_LIVE_OR_FRESH
+        return any(g["status"] in live for g in self._games)
 
     def num_games(self):
         return len(self._games)
@@ -128,14 +166,10 @@ class Schedule:
         return self.__current_game()
 
     def _game_index_for_preferred_team(self):
-        if self.config.preferred_teams:
-            team_name = data.teams.TEAM_FULL[self.config.preferred_teams[0]]
+        if self._preferred_team_names:
+            indices = self._game_indices_by_team.get(self._preferred_team_names[0], [])
             return next(
-                (
-                    i
-                    for i, game in enumerate(self._games)
-                    if team_name in [game["away_name"], game["home_name"]] and status.is_live(game["status"])
-                ),
+                (i for i in indices if status.is_live(self._games[i]["status"])),
                 -1,  # no live games for preferred team
             )
 
@@ -154,7 +188,6 @@ class Schedule:
             return Game.from_scheduled(scheduled_game, self.config.delay_in_10s_of_seconds)
         return None
 
-    @staticmethod
-    def __filter_list_of_games(games, filter_teams):
-        teams = [data.teams.TEAM_FULL[t] for t in filter_teams]
-        return list(game for game in games if set([game["away_name"], game["home_name"]]).intersection(set(teams)))
+    def __filter_list_of_games(self, games):
+        preferred = self._preferred_team_name_set
+        return [game for game in games if game["away_name"] in preferred or game["home_name"] in preferred]
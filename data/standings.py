@@ -1,14 +1,24 @@
+import os
+import pickle
 import time
 from datetime import datetime, timedelta
+from itertools import cycle
 
 import statsapi
 
 import debug
 from data import teams
+from data.network import network_request
 from data.update import UpdateStatus
 
 STANDINGS_UPDATE_RATE = 15 * 60  # 15 minutes between standings updates
 
+# Standings change at most once per completed game, so recent results are pickled to
+# disk and reused across restarts. The TTL stays under STANDINGS_UPDATE_RATE so the
+# periodic refresh still reaches the API; the cache mostly makes cold starts instant.
+STANDINGS_CACHE_DIR = os.path.join(os.path.expanduser("~"), ".cache", "mlb-led-scoreboard")
+STANDINGS_CACHE_TTL = 10 * 60
+
 
 API_FIELDS = (
     "records,standingsType,teamRecords,team,abbreviation,division,league,nameShort,gamesBack,wildCardGamesBack,"
@@ -24,9 +34,12 @@ class Standings:
         self.starttime = time.time()
         self.preferred_divisions = config.preferred_divisions
         self.wild_cards = any("Wild" in division for division in config.preferred_divisions)
-        self.current_division_index = 0
+        # cycling through the preferred divisions beats recomputing a wraparound index each advance
+        self._division_cycle = cycle(self.preferred_divisions)
+        self.current_division_name = next(self._division_cycle, None)
 
         self.standings = []
+        self._standings_by_name = {}
         self.leagues = {}
 
         self.update(True)
@@ -36,9 +49,7 @@ class Standings:
             today = datetime.strptime(self.config.demo_date, "%Y-%m-%d")
         else:
             today = datetime.today()
-            end_of_day = datetime.strptime(self.config.end_of_day, "%H:%M").replace(
-                year=today.year, month=today.month, day=today.day
-            )
+            end_of_day = datetime.combine(today, self.config.end_of_day)
             if end_of_day > datetime.now():
                 today -= timedelta(days=1)
         return today.date()
@@ -48,28 +59,33 @@ class Standings:
             self.date = self.__parse_today()
             debug.log("Refreshing standings for %s", self.date.strftime("%m/%d/%Y"))
             self.starttime = time.time()
-            try:
+            with network_request("refreshing standings") as request:
                 if not self.is_postseason():
 
-                    season_params = {
-                        "standingsTypes": "regularSeason",
-                        "leagueId": "103,104",
-                        "hydrate": "division,team,league",
-                        "season": self.date.strftime("%Y"),
-                        "fields": API_FIELDS,
-                    }
-                    if self.date != datetime.today().date():
-                        season_params["date"] = self.date.strftime("%m/%d/%Y")
+                    standings = self.__load_cached_standings()
+                    if standings is None:
+                        season_params = {
+                            "standingsTypes": "regularSeason",
+                            "leagueId": "103,104",
+                            "hydrate": "division,team,league",
+                            "season": self.date.strftime("%Y"),
+                            "fields": API_FIELDS,
+                        }
+                        if self.date != datetime.today().date():
+                            season_params["date"] = self.date.strftime("%m/%d/%Y")
+
+                        divisons_data = statsapi.get("standings", season_params)
+                        standings = [Division(division_data) for division_data in divisons_data["records"]]
 
-                    divisons_data = statsapi.get("standings", season_params)
-                    standings = [Division(division_data) for division_data in divisons_data["records"]]
+                        if self.wild_cards:
+                            season_params["standingsTypes"] = "wildCard"
+                            wc_data = statsapi.get("standings", season_params)
+                            standings += [Division(data, wc=True) for data in wc_data["records"]]
 
-                    if self.wild_cards:
-                        season_params["standingsTypes"] = "wildCard"
-                        wc_data = statsapi.get("standings", season_params)
-                        standings += [Division(data, wc=True) for data in wc_data["records"]]
+                        self.__save_cached_standings(standings)
 
                     self.standings = standings
+                    self._standings_by_name = {division.name: division for division in standings}
 
                 else:
                     postseason_data = statsapi.get(
@@ -83,12 +99,10 @@ class Standings:
                     self.leagues["AL"] = League(postseason_data, "AL")
                     self.leagues["NL"] = League(postseason_data, "NL")
 
-            except:
-                debug.exception("Failed to refresh standings.")
+            if not request.ok:
                 return UpdateStatus.FAIL
-            else:
 
-                return UpdateStatus.SUCCESS
+            return UpdateStatus.SUCCESS
 
         return UpdateStatus.DEFERRED
 
@@ -97,6 +111,33 @@ class Standings:
         time_delta = endtime - self.starttime
         return time_delta >= STANDINGS_UPDATE_RATE
 
+    def __cache_path(self):
+        suffix = "-wc" if self.wild_cards else ""
+        return os.path.join(STANDINGS_CACHE_DIR, "standings-{}{}.pkl".format(self.date.strftime("%Y-%m-%d"), suffix))
+
+    def __load_cached_standings(self):
+        """Returns standings pickled by a recent run, or None if they are missing or stale."""
+        path = self.__cache_path()
+        try:
+            if time.time() - os.path.getmtime(path) < STANDINGS_CACHE_TTL:
+                with open(path, "rb") as cache_file:
+                    debug.log("Loading standings from %s", path)
+                    return pickle.load(cache_file)
+        except OSError:
+            pass
+        except Exception:
+            debug.exception("Failed to read cached standings.")
+        return None
+
+    def __save_cached_standings(self, standings):
+        # The cache is best effort; a read-only filesystem shouldn't break standings
+        try:
+            os.makedirs(STANDINGS_CACHE_DIR, exist_ok=True)
+            with open(self.__cache_path(), "wb") as cache_file:
+                pickle.dump(standings, cache_file)
+        except Exception:
+            debug.log("Could not write standings cache")
+
     def populated(self):
         return bool(self.standings) or (bool(self.leagues) and self.is_postseason())
 
@@ -104,21 +145,15 @@ class Standings:
         return self.date > self.playoffs_start_date
 
     def __standings_for(self, division_name):
-        return next(division for division in self.standings if division.name == division_name)
+        return self._standings_by_name[division_name]
 
     def current_standings(self):
-        return self.__standings_for(self.preferred_divisions[self.current_division_index])
+        return self.__standings_for(self.current_division_name)
 
     def advance_to_next_standings(self):
-        self.current_division_index = self.__next_division_index()
+        self.current_division_name = next(self._division_cycle)
         return self.current_standings()
 
-    def __next_division_index(self):
-        counter = self.current_division_index + 1
-        if counter >= len(self.preferred_divisions):
-            counter = 0
-        return counter
-
 
 class Division:
     def __init__(self, data, wc=False):
@@ -16,3 +16,8 @@ error = logger.error
 log = logger.debug
 
 exception = logger.exception
+
+
+def is_enabled():
+    """Returns whether debug-level logging is on, so callers can skip building log-only objects."""
+    return logger.isEnabledFor(logging.DEBUG)
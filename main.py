@@ -88,7 +88,8 @@ def main(matrix, config_base):
 def __refresh_news(render_thread, data):  # type: (threading.Thread, Data) -> None
     debug.log("Main has selected the news to refresh")
     while render_thread.is_alive():
-        time.sleep(30)
+        # this loop never polls game data, so the live-cadence intervals don't apply
+        time.sleep(max(30, data.next_refresh_interval()))
         data.refresh_weather()
         data.refresh_news_ticker()
 
@@ -97,7 +98,7 @@ def __refresh_standings(render_thread, data):  # type: (threading.Thread, Data)
     if data.standings.populated():
         debug.log("Main has selected the standings to refresh")
         while render_thread.is_alive():
-            time.sleep(30)
+            time.sleep(max(30, data.next_refresh_interval()))
             data.refresh_standings()
     else:
         __refresh_news(render_thread, data)
@@ -106,7 +107,7 @@ def __refresh_standings(render_thread, data):  # type: (threading.Thread, Data)
 def __refresh_offday(render_thread, data):  # type: (threading.Thread, Data) -> None
     debug.log("Main has selected the offday information to refresh")
     while render_thread.is_alive():
-        time.sleep(30)
+        time.sleep(max(30, data.next_refresh_interval()))
         data.refresh_standings()
         data.refresh_weather()
         data.refresh_news_ticker()
@@ -131,6 +132,8 @@ def __refresh_gameday(render_thread, data):  # type: (threading.Thread, Data) ->
                 data.refresh_weather()
                 cont = True
             if cont:
+                # nothing is live, so there is no need to spin at the live cadence
+                time.sleep(data.next_refresh_interval())
                 continue
 
         # make sure a game is populated